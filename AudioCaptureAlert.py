@@ -18,13 +18,20 @@ import obspython as obs
 from types import SimpleNamespace
 from ctypes import *
 from ctypes.util import find_library
-import math
+import base64
+import collections
+import os
+import queue
 import subprocess
+import sys
 import threading
+import time
+import uuid
 
 # Load the OBS library
 obsffi = CDLL(find_library("obs"))
 G = SimpleNamespace()
+G_dict = G.__dict__  # Direct access for the audio-thread callback
 
 def wrap(funcname, restype, argtypes):
     """Simplify wrapping ctypes functions in obsffi"""
@@ -52,26 +59,52 @@ wrap("obs_volmeter_remove_callback", None, argtypes=[POINTER(Volmeter), volmeter
 wrap("obs_volmeter_attach_source", c_bool, argtypes=[POINTER(Volmeter), POINTER(Source)])
 
 # Volmeter callback function
+# Runs on the OBS audio thread. ctypes holds the GIL for the whole call, so each
+# store below is a single atomic dict write that event_loop sees whole; no
+# further synchronization is needed.
 @volmeter_callback_t
 def volmeter_callback(data, mag, peak, input):
-    G.noise = float(peak[0])  # Peak volume in dB
+    g = G_dict
+    if not g["plugin_enabled"]:
+        return
+    noise = peak[0]  # Peak volume in dB (already a Python float)
+    # G.noise is only logged; leave it alone while an alert is already out
+    if not g["notification_sent"]:
+        g["noise"] = noise
+    # Every peak above the threshold breaks the silence, even between ticks
+    if noise > g["silence_db_threshold"]:
+        g["last_sound_ns"] = time.monotonic_ns()
 
 # Constants and global variables
 OBS_FADER_LOG = 2
+MIN_TIMER_DELAY_MS = 100  # Shortest adaptive event_loop interval
+SCENE_CACHE_DROP_MS = 100  # Delay before a dirty scene cache releases its refs
+NOISE_FLOOR_DB = -200.0  # "No signal yet" level, far below any real device floor
 G.lock = False
 G.start_delay = 1  # Delay before starting to monitor
-G.duration = 0
-G.noise = -math.inf  # Default value for noise (silence)
+G.load_ns = time.monotonic_ns()  # Script load time (monotonic ns), start_delay counts from here
+G.noise = NOISE_FLOOR_DB  # Default value for noise (silence)
 G.tick = 10000  # Default timer tick in milliseconds (10 seconds)
-G.tick_mili = G.tick * 0.001
+G.timer_delay = None  # Interval event_loop is currently armed with (None = not armed)
 G.mic_source_name = ""  # Name of the audio capture source
+G.mic_source_name_b = b""  # UTF-8 encoded mic_source_name
+G.mic_source_name_c = c_char_p(G.mic_source_name_b)  # Pre-built ctypes argument for obs_get_source_by_name
 G.image_source_name = ""  # Name of the image source to enable
 G.media_source_name = ""  # Name of the media source to enable
 G.video_source_name = ""  # Name of the video capture device to enable
+G.alert_source_name = ""  # Whichever of the three above is selected
+
+# "combined_source" prefix -> G field holding the selected source name
+ALERT_SOURCE_FIELDS = {
+    "image": "image_source_name",
+    "media": "media_source_name",
+    "video": "video_source_name",
+}
 G.volmeter = None  # Placeholder for the volmeter instance
 G.silence_duration = 0  # Duration of silence in seconds
+G.last_sound_ns = time.monotonic_ns()  # Last peak above threshold (monotonic ns, set by volmeter_callback)
 G.silence_threshold = 60  # Default silence threshold in seconds (1 minute)
-G.silence_db_threshold = -60  # Silence threshold in dB (adjust as needed)
+G.silence_db_threshold = -60.0  # Silence threshold in dB (adjust as needed, keep it a float)
 G.plugin_enabled = False  # Plugin disabled by default
 G.enable_only_active = False  # Only enable when streaming/recording
 G.event_logging = False  # Event logging disabled by default
@@ -85,88 +118,570 @@ G.last_notification_time = 0  # Track last notification time
 G.notification_sent = False  # Track if notification was sent for current silence period
 G.enable_obs_source = False  # Option to also enable OBS source
 G.prev_output_active = False  # Track previous streaming/recording state
+G.scene_item_cache = {}  # Alert source name -> its scene items (refs held until the cache goes dirty)
+G.scene_count = 0  # Number of scenes seen by the last cache rebuild
+G.scene_signal_sources = []  # Scene source refs whose item_add/item_remove signals we listen to
+G.scene_cache_dirty = False  # Set when a scene's items change; next lookup rebuilds
+G.scene_drop_armed = False  # Whether drop_scene_cache is scheduled
+G.scene_cache_lock = threading.RLock()  # Guards the cache: lookups run on the graphics thread, cleanup on the UI thread
+G.last_enable_state = None  # Visibility last pushed by enable_source (None = unknown)
+G.props_source_cache = None  # Source id -> source names for the properties dropdowns (None = stale)
+G.props_source_generation = 0  # Bumped on every invalidation, so a racing build is not stored
 
-def send_windows_notification(title, message):
-    """Send Windows toast notification using PowerShell (no additional packages required)"""
-    def _send():
-        try:
-            # PowerShell script for toast notification
-            ps_script = f'''
-[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom, ContentType = WindowsRuntime] | Out-Null
+# Notification delivery (WinRT notifier and PowerShell session live in notification_worker)
+G.pending_notifications = collections.deque()  # (title, message) waiting for the batch window
+G.batch_timer_armed = False  # Whether flush_notifications is scheduled
+G.notify_q = None  # Queue feeding notification_worker (None = worker stopped)
+G.notify_thread = None  # The single notification worker thread
+
+NOTIFICATION_BATCH_MS = 500  # Notifications within this window are combined into one toast
+NOTIFICATION_QUEUE_SIZE = 4  # Oldest queued toast is dropped beyond this
 
-$template = @"
-<toast duration="short">
+TOAST_APP_ID = "OBS Studio"
+TOAST_TEMPLATE = """<toast duration="short">
     <visual>
         <binding template="ToastText02">
-            <text id="1">{title}</text>
-            <text id="2">{message}</text>
+            <text id="1"></text>
+            <text id="2"></text>
         </binding>
     </visual>
     <audio src="ms-winsoundevent:Notification.Default"/>
-</toast>
-"@
-
-$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
-$xml.LoadXml($template)
-$toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
-[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("OBS Studio").Show($toast)
-'''
-            # Run PowerShell in hidden window
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0  # SW_HIDE
-            
-            subprocess.run(
-                ['powershell', '-ExecutionPolicy', 'Bypass', '-Command', ps_script],
-                startupinfo=startupinfo,
-                capture_output=True,
-                timeout=10
-            )
+</toast>"""
+
+# Statements sent once to the PowerShell session; Show-Toast takes base64 UTF-8 text
+# so neither quoting nor the console code page can mangle the message
+PS_SESSION_SETUP = [
+    "[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null",
+    "[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom, ContentType = WindowsRuntime] | Out-Null",
+    "$xml = New-Object Windows.Data.Xml.Dom.XmlDocument",
+    "$xml.LoadXml('" + TOAST_TEMPLATE.replace("\n", "") + "')",
+    f"$notifier = [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier('{TOAST_APP_ID}')",
+    "function Decode($s) { [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($s)) }",
+    "function Show-Toast($t, $m) { "
+    "$xml.SelectSingleNode(\"/toast/visual/binding/text[@id='1']\").InnerText = Decode $t; "
+    "$xml.SelectSingleNode(\"/toast/visual/binding/text[@id='2']\").InnerText = Decode $m; "
+    "$notifier.Show([Windows.UI.Notifications.ToastNotification]::new($xml)) }",
+]
+
+# One-shot fallback: the same script plus a call reading the (base64) text from the
+# environment, so the -EncodedCommand argument is constant and built only once
+PS_ONESHOT_ENCODED = base64.b64encode("\n".join(
+    PS_SESSION_SETUP + ["Show-Toast $env:ACA_TOAST_TITLE $env:ACA_TOAST_MESSAGE"]
+).encode("utf-16-le")).decode("ascii")
+PS_FLAGS = ['-NoProfile', '-NoLogo', '-NonInteractive', '-ExecutionPolicy', 'Bypass']
+
+RO_INIT_MULTITHREADED = 1
+RPC_E_CHANGED_MODE = -2147417850  # 0x80010106: COM already initialized as STA
+
+class GUID(Structure):
+    _fields_ = [("Data1", c_uint32), ("Data2", c_uint16), ("Data3", c_uint16), ("Data4", c_ubyte * 8)]
+
+def _guid(value):
+    return GUID.from_buffer_copy(uuid.UUID(value).bytes_le)
+
+IID_IToastNotificationManagerStatics = _guid("50AC103F-D235-4598-BBEF-98FE4D1A3AD4")
+IID_IToastNotificationFactory = _guid("04124B20-82C6-4229-B109-FD9ED4662B53")
+IID_IXmlDocument = _guid("F7F3A506-1E87-42D6-BCFB-B8C809FA5494")
+IID_IXmlDocumentIO = _guid("6CD0E74E-EE65-4489-9EBF-CA43E87BA637")
+IID_IXmlNodeSelector = _guid("63DBBA8B-D0DB-4FE1-B745-F9433AFDC25B")
+IID_IXmlNodeSerializer = _guid("5CC5B382-E6DD-4991-ABEF-06D8D2E7BD0C")
+
+def _com_method(obj, index, *argtypes):
+    """Bind vtable slot `index` of a COM object (slots 0-5 are IInspectable)"""
+    vtbl = cast(obj, POINTER(POINTER(c_void_p))).contents
+    return WINFUNCTYPE(HRESULT, c_void_p, *argtypes)(vtbl[index])
+
+def _com_query(obj, iid):
+    out = c_void_p()
+    _com_method(obj, 0, POINTER(GUID), POINTER(c_void_p))(obj, byref(iid), byref(out))
+    return out
+
+def _com_release(obj):
+    vtbl = cast(obj, POINTER(POINTER(c_void_p))).contents
+    WINFUNCTYPE(c_ulong, c_void_p)(vtbl[2])(obj)
+
+def _hstring(state, text):
+    handle = c_void_p()
+    state.combase.WindowsCreateString(text, len(text.encode("utf-16-le")) // 2, byref(handle))
+    return handle
+
+def _activation_factory(state, class_name, iid):
+    name = _hstring(state, class_name)
+    factory = c_void_p()
+    try:
+        state.combase.RoGetActivationFactory(name, byref(iid), byref(factory))
+    finally:
+        state.combase.WindowsDeleteString(name)
+    return factory
+
+def init_toast_notifier(state):
+    """Create the WinRT toast notifier and template document once."""
+    try:
+        combase = WinDLL("combase")
+        combase.RoInitialize.restype = c_long
+        combase.RoInitialize.argtypes = [c_int]
+        combase.RoUninitialize.restype = None
+        combase.RoUninitialize.argtypes = []
+        combase.WindowsCreateString.restype = HRESULT
+        combase.WindowsCreateString.argtypes = [c_wchar_p, c_uint, POINTER(c_void_p)]
+        combase.WindowsDeleteString.restype = HRESULT
+        combase.WindowsDeleteString.argtypes = [c_void_p]
+        combase.RoGetActivationFactory.restype = HRESULT
+        combase.RoGetActivationFactory.argtypes = [c_void_p, POINTER(GUID), POINTER(c_void_p)]
+        combase.RoActivateInstance.restype = HRESULT
+        combase.RoActivateInstance.argtypes = [c_void_p, POINTER(c_void_p)]
+        state.combase = combase
+
+        hr = combase.RoInitialize(RO_INIT_MULTITHREADED)
+        if hr < 0 and hr != RPC_E_CHANGED_MODE:
+            raise OSError(f"RoInitialize failed (0x{hr & 0xFFFFFFFF:08X})")
+        state.ro_initialized = hr >= 0
+
+        # IToastNotifier for our app id
+        statics = _activation_factory(state, "Windows.UI.Notifications.ToastNotificationManager",
+                                      IID_IToastNotificationManagerStatics)
+        app_id = _hstring(state, TOAST_APP_ID)
+        try:
+            state.toast_notifier = c_void_p()
+            _com_method(statics, 7, c_void_p, POINTER(c_void_p))(statics, app_id, byref(state.toast_notifier))
+        finally:
+            combase.WindowsDeleteString(app_id)
+            _com_release(statics)
+
+        state.toast_factory = _activation_factory(state, "Windows.UI.Notifications.ToastNotification",
+                                              IID_IToastNotificationFactory)
+
+        # Load the template once; only the <text> nodes change per notification
+        class_name = _hstring(state, "Windows.Data.Xml.Dom.XmlDocument")
+        document = c_void_p()
+        try:
+            combase.RoActivateInstance(class_name, byref(document))
+        finally:
+            combase.WindowsDeleteString(class_name)
+        try:
+            document_io = _com_query(document, IID_IXmlDocumentIO)
+            template = _hstring(state, TOAST_TEMPLATE)
+            try:
+                _com_method(document_io, 6, c_void_p)(document_io, template)
+            finally:
+                combase.WindowsDeleteString(template)
+                _com_release(document_io)
+            state.toast_xml = _com_query(document, IID_IXmlDocument)
+
+            selector = _com_query(document, IID_IXmlNodeSelector)
+            try:
+                for text_id in (1, 2):
+                    xpath = _hstring(state, f"/toast/visual/binding/text[@id='{text_id}']")
+                    node = c_void_p()
+                    try:
+                        _com_method(selector, 6, c_void_p, POINTER(c_void_p))(selector, xpath, byref(node))
+                    finally:
+                        combase.WindowsDeleteString(xpath)
+                    try:
+                        state.toast_text_nodes.append(_com_query(node, IID_IXmlNodeSerializer))
+                    finally:
+                        _com_release(node)
+            finally:
+                _com_release(selector)
+        finally:
+            _com_release(document)
+        if G.event_logging:
+            print("WinRT toast notifier initialized.")
+    except Exception as e:
+        release_toast_notifier(state)
+        print(f"WinRT toast notifier unavailable, using PowerShell: {e}")
+
+def release_toast_notifier(state):
+    """Release all WinRT objects created by init_toast_notifier."""
+    for obj in state.toast_text_nodes + [state.toast_xml, state.toast_factory, state.toast_notifier]:
+        if obj:
+            _com_release(obj)
+    state.toast_text_nodes = []
+    state.toast_xml = None
+    state.toast_factory = None
+    state.toast_notifier = None
+    if state.ro_initialized:
+        state.combase.RoUninitialize()
+        state.ro_initialized = False
+    state.combase = None
+
+def show_toast(state, title, message):
+    """Show a toast through the cached WinRT notifier."""
+    for node, text in zip(state.toast_text_nodes, (title, message)):
+        value = _hstring(state, text)
+        try:
+            _com_method(node, 8, c_void_p)(node, value)  # put_InnerText
+        finally:
+            state.combase.WindowsDeleteString(value)
+    toast = c_void_p()
+    _com_method(state.toast_factory, 6, c_void_p, POINTER(c_void_p))(state.toast_factory, state.toast_xml, byref(toast))
+    try:
+        _com_method(state.toast_notifier, 6, c_void_p)(state.toast_notifier, toast)
+    finally:
+        _com_release(toast)
+
+def _hidden_startupinfo():
+    """STARTUPINFO that keeps the PowerShell console window hidden"""
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = 0  # SW_HIDE
+    return startupinfo
+
+def _b64(text):
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+def start_powershell_session(state):
+    """Start a hidden PowerShell process that shows toasts read from stdin."""
+    try:
+        state.ps_session = subprocess.Popen(
+            ['powershell', *PS_FLAGS, '-Command', '-'],
+            startupinfo=_hidden_startupinfo(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        state.ps_session.stdin.write("".join(line + "\n" for line in PS_SESSION_SETUP).encode("ascii"))
+        state.ps_session.stdin.flush()
+        if G.event_logging:
+            print("PowerShell notification session started.")
+    except Exception as e:
+        stop_powershell_session(state)
+        print(f"Failed to start PowerShell notification session: {e}")
+
+def stop_powershell_session(state):
+    """Close the PowerShell session; it exits once stdin is closed."""
+    session, state.ps_session = state.ps_session, None
+    if not session:
+        return
+    try:
+        session.stdin.close()
+        session.wait(timeout=1)
+    except Exception:
+        session.kill()
+
+def send_windows_notification(title, message):
+    """Queue a Windows toast notification; a burst is shown as one combined toast"""
+    G.pending_notifications.append((title, message))
+    if not G.batch_timer_armed:
+        G.batch_timer_armed = True
+        obs.timer_add(flush_notifications, NOTIFICATION_BATCH_MS)
+
+def flush_notifications():
+    """One-shot timer: show all pending notifications as a single toast."""
+    obs.timer_remove(flush_notifications)
+    G.batch_timer_armed = False
+    if not G.pending_notifications:
+        return
+    title = G.pending_notifications[0][0]
+    message = "\n".join(dict.fromkeys(message for _, message in G.pending_notifications))
+    G.pending_notifications.clear()
+    if not G.notify_q:
+        if G.event_logging:
+            print("Windows notifications are only available on Windows")
+        return
+    queue_notification((title, message))
+
+def queue_notification(item):
+    """Hand an item to the worker, dropping the oldest queued one when full."""
+    if not G.notify_q:
+        return
+    while True:
+        try:
+            G.notify_q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                G.notify_q.get_nowait()
+            except queue.Empty:
+                pass
+
+def notification_worker(notify_q):
+    """Deliver queued notifications on one thread that also owns the notifiers."""
+    # Kept local so a worker outliving script_unload only ever releases its own objects
+    state = SimpleNamespace(
+        combase=None,  # combase.dll handle
+        ro_initialized=False,  # Whether RoInitialize needs a matching RoUninitialize
+        toast_notifier=None,  # IToastNotifier
+        toast_factory=None,  # IToastNotificationFactory
+        toast_xml=None,  # IXmlDocument holding the toast template
+        toast_text_nodes=[],  # IXmlNodeSerializer for <text id="1"> and <text id="2">
+        ps_session=None,  # Long-lived PowerShell process used when WinRT is unavailable
+        initialized=False,  # WinRT setup is deferred until the first notification
+    )
+    while True:
+        item = notify_q.get()
+        if item is None:
+            break
+        if not state.initialized:
+            # deliver_notification starts the PowerShell session itself if WinRT fails
+            init_toast_notifier(state)
+            state.initialized = True
+        deliver_notification(state, *item)
+    release_toast_notifier(state)
+    stop_powershell_session(state)
+
+def start_notification_worker():
+    G.notify_q = queue.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+    G.notify_thread = threading.Thread(target=notification_worker, args=(G.notify_q,), daemon=True)
+    G.notify_thread.start()
+
+def stop_notification_worker():
+    """Ask the worker to release its notifiers and exit."""
+    if not G.notify_q:
+        return
+    queue_notification(None)
+    G.notify_q = None
+    G.notify_thread.join(timeout=2)
+    G.notify_thread = None
+
+def deliver_notification(state, title, message):
+    """Show a Windows toast notification, in-process via WinRT when available"""
+    if state.toast_notifier:
+        try:
+            show_toast(state, title, message)
             if G.event_logging:
                 print(f"Windows notification sent: {title} - {message}")
+            return
         except Exception as e:
-            print(f"Failed to send Windows notification: {e}")
-    
-    # Run in separate thread to avoid blocking OBS
-    thread = threading.Thread(target=_send, daemon=True)
-    thread.start()
+            print(f"Failed to send WinRT notification, falling back to PowerShell: {e}")
+    if not state.ps_session or state.ps_session.poll() is not None:
+        start_powershell_session(state)
+    if state.ps_session:
+        try:
+            state.ps_session.stdin.write(f"Show-Toast '{_b64(title)}' '{_b64(message)}'\n".encode("ascii"))
+            state.ps_session.stdin.flush()
+            if G.event_logging:
+                print(f"Windows notification sent: {title} - {message}")
+            return
+        except OSError as e:
+            stop_powershell_session(state)
+            print(f"PowerShell notification session failed: {e}")
+    send_powershell_notification(title, message)
+
+def send_powershell_notification(title, message):
+    """Send Windows toast notification using PowerShell (no additional packages required)"""
+    try:
+        # Run PowerShell in hidden window (blocks the notification worker only)
+        subprocess.run(
+            ['powershell', *PS_FLAGS, '-EncodedCommand', PS_ONESHOT_ENCODED],
+            startupinfo=_hidden_startupinfo(),
+            env={**os.environ, "ACA_TOAST_TITLE": _b64(title), "ACA_TOAST_MESSAGE": _b64(message)},
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=10
+        )
+        if G.event_logging:
+            print(f"Windows notification sent: {title} - {message}")
+    except Exception as e:
+        print(f"Failed to send Windows notification: {e}")
 
 class _Functions:
     def __init__(self, source_name=None):
         self.source_name = source_name
 
     def set_visible_all(self, visible):
-        """Cycle through all scenes, manually toggling visibility of the source"""
+        """Toggle visibility of every cached scene item of the source, returning whether any was found"""
         if G.event_logging:
             print(f"Attempting to set visibility of '{self.source_name}' to {visible}")
-        scenes = obs.obs_frontend_get_scenes()
-        if not scenes:
+        with G.scene_cache_lock:
+            if G.scene_cache_dirty:
+                rebuild_scene_cache()
+            changed = self.set_visible_items(G.scene_item_cache.get(self.source_name), visible)
+            if not changed:
+                # Missing or only removed items: the source may have moved since the last rebuild
+                if G.scene_count <= 1:
+                    return self.set_visible_fast(visible)
+                rebuild_scene_cache()
+                changed = self.set_visible_items(G.scene_item_cache.get(self.source_name), visible)
+        if not changed:
             if G.event_logging:
-                print("No scenes found!")
-            return
-        for scene in scenes:
-            scene_test = obs.obs_scene_from_source(scene)
-            if not scene_test:
-                if G.event_logging:
-                    print(f"Failed to get scene from source")
-                continue
-            in_scene = obs.obs_scene_find_source(scene_test, self.source_name)
-            if in_scene:
-                if G.event_logging:
-                    print(f"Found source '{self.source_name}' in scene '{obs.obs_source_get_name(scene)}'")
-                obs.obs_sceneitem_set_visible(in_scene, visible)
-                if G.event_logging:
-                    print(f"Set visibility of '{self.source_name}' to {visible}")
-            else:
-                if G.event_logging:
-                    print(f"Source '{self.source_name}' not found in scene '{obs.obs_source_get_name(scene)}'")
-        obs.source_list_release(scenes)
+                print(f"Source '{self.source_name}' not found in any scene")
+            return False
+        if G.event_logging:
+            print(f"Set visibility of '{self.source_name}' to {visible} in {changed} scene(s)")
+        return True
+
+    def set_visible_items(self, items, visible):
+        """Toggle cached items still attached to a scene, returning how many were toggled"""
+        changed = 0
+        for item in items or ():
+            # A removed item has no parent scene; our reference only keeps it alive
+            if obs.obs_sceneitem_get_scene(item):
+                obs.obs_sceneitem_set_visible(item, visible)
+                changed += 1
+        return changed
+
+    def set_visible_fast(self, visible):
+        """Toggle the source in the current scene only, caching the scene item (caller holds scene_cache_lock)"""
+        current = obs.obs_frontend_get_current_scene()
+        if not current:
+            if G.event_logging:
+                print("No current scene!")
+            return False
+        scene = obs.obs_scene_from_source(current)
+        in_scene = obs.obs_scene_find_source(scene, self.source_name) if scene else None
+        if in_scene:
+            obs.obs_sceneitem_addref(in_scene)
+            for item in G.scene_item_cache.pop(self.source_name, ()):
+                obs.obs_sceneitem_release(item)
+            G.scene_item_cache[self.source_name] = [in_scene]
+            obs.obs_sceneitem_set_visible(in_scene, visible)
+            if G.event_logging:
+                print(f"Set visibility of '{self.source_name}' to {visible} in current scene")
+        elif G.event_logging:
+            print(f"Source '{self.source_name}' not found in current scene")
+        obs.obs_source_release(current)
+        return bool(in_scene)
+
+def on_scene_items_changed(calldata):
+    """Scene signal handler: an item was added to or removed from a scene."""
+    mark_scene_cache_dirty()
+
+def mark_scene_cache_dirty():
+    """Invalidate the scene cache and release its refs shortly, so removed sources can be freed."""
+    G.scene_cache_dirty = True
+    if (G.scene_item_cache or G.scene_signal_sources) and not G.scene_drop_armed:
+        G.scene_drop_armed = True
+        obs.timer_add(drop_scene_cache, SCENE_CACHE_DROP_MS)
+
+def drop_scene_cache():
+    """One-shot timer: release the refs held by a dirty scene cache."""
+    obs.timer_remove(drop_scene_cache)
+    G.scene_drop_armed = False
+    with G.scene_cache_lock:
+        if G.scene_cache_dirty:
+            release_scene_cache()
+
+def release_scene_cache():
+    """Release all scene item references and scene signal connections held by the cache (caller holds scene_cache_lock)."""
+    for items in G.scene_item_cache.values():
+        for item in items:
+            obs.obs_sceneitem_release(item)
+    G.scene_item_cache = {}
+    for scene in G.scene_signal_sources:
+        signal_handler = obs.obs_source_get_signal_handler(scene)
+        for signal in ("item_add", "item_remove"):
+            obs.signal_handler_disconnect(signal_handler, signal, on_scene_items_changed)
+        obs.obs_source_release(scene)
+    G.scene_signal_sources = []
+
+def rebuild_scene_cache():
+    """Collect the alert source's scene items across all scenes (caller holds scene_cache_lock)."""
+    release_scene_cache()
+    G.scene_cache_dirty = False
+    G.last_enable_state = None  # Sync visibility into new scenes on the next tick
+    source_name = G.alert_source_name
+    if not (G.plugin_enabled and G.enable_obs_source and source_name):
+        return
+    scenes = obs.obs_frontend_get_scenes()
+    G.scene_count = len(scenes) if scenes else 0
+    if not scenes:
+        if G.event_logging:
+            print("No scenes found!")
+        return
+    for scene in scenes:
+        scene_test = obs.obs_scene_from_source(scene)
+        if not scene_test:
+            if G.event_logging:
+                print(f"Failed to get scene from source")
+            continue
+        # Items added or removed inside this scene invalidate the cache
+        scene_ref = obs.obs_source_get_ref(scene)
+        if scene_ref:
+            signal_handler = obs.obs_source_get_signal_handler(scene_ref)
+            for signal in ("item_add", "item_remove"):
+                obs.signal_handler_connect(signal_handler, signal, on_scene_items_changed)
+            G.scene_signal_sources.append(scene_ref)
+        in_scene = obs.obs_scene_find_source(scene_test, source_name)
+        if in_scene:
+            obs.obs_sceneitem_addref(in_scene)
+            G.scene_item_cache.setdefault(source_name, []).append(in_scene)
+    obs.source_list_release(scenes)
+    if G.event_logging:
+        print(f"Scene cache rebuilt ({len(G.scene_item_cache.get(source_name, ()))} items of '{source_name}')")
+
+def attach_volmeter():
+    """Create the volmeter and attach it to the audio capture source (once)."""
+    if G.event_logging:
+        print("Initializing volmeter...")
+    source = g_obs_get_source_by_name(G.mic_source_name_c)
+    if not source:
+        print(f"Error: Audio Capture source '{G.mic_source_name}' not found!")
+        return False
+    G.volmeter = g_obs_volmeter_create(OBS_FADER_LOG)
+    if not G.volmeter:
+        print("Error: Failed to create volmeter!")
+        g_obs_source_release(source)
+        return False
+    g_obs_volmeter_add_callback(G.volmeter, volmeter_callback, None)
+    if not g_obs_volmeter_attach_source(G.volmeter, source):
+        print("Error: Failed to attach volmeter to Audio Capture source!")
+        g_obs_volmeter_remove_callback(G.volmeter, volmeter_callback, None)
+        g_obs_volmeter_destroy(G.volmeter)
+        G.volmeter = None
+        g_obs_source_release(source)
+        return False
+    g_obs_source_release(source)
+    G.lock = True
+    G.noise = NOISE_FLOOR_DB
+    reset_silence()
+    if G.event_logging:
+        print("Volmeter attached to Audio Capture source.")
+    return True
+
+def arm_event_loop(delay_ms):
+    """(Re)arm the event_loop timer, unless it already runs at this interval."""
+    if G.timer_delay == delay_ms:
+        return
+    obs.timer_remove(event_loop)
+    obs.timer_add(event_loop, delay_ms)
+    G.timer_delay = delay_ms
+
+def disarm_event_loop():
+    obs.timer_remove(event_loop)
+    G.timer_delay = None
+
+def reset_silence():
+    """Restart silence accounting from now."""
+    G.last_sound_ns = time.monotonic_ns()
+    G.silence_duration = 0
+    G.notification_sent = False
+
+PROPS_SOURCE_SIGNALS = ("source_create", "source_remove", "source_destroy", "source_rename")
+
+def on_source_list_changed(calldata):
+    """Global signal handler: a source was created, removed, destroyed or renamed."""
+    invalidate_props_source_cache()
+
+def invalidate_props_source_cache():
+    G.props_source_generation += 1
+    G.props_source_cache = None
+
+def get_props_source_cache():
+    """Return source names grouped by source id, enumerating sources only when stale."""
+    cache = G.props_source_cache
+    if cache is None:
+        generation = G.props_source_generation
+        cache = {}
+        sources = obs.obs_enum_sources()
+        if sources:
+            for source in sources:
+                cache.setdefault(obs.obs_source_get_id(source), []).append(obs.obs_source_get_name(source))
+            obs.source_list_release(sources)
+        # Signals fire on any thread; keep the result only if none arrived meanwhile
+        if generation == G.props_source_generation:
+            G.props_source_cache = cache
+    return cache
 
 # Event loop for monitoring audio levels
 def event_loop():
-    """Check audio levels every tick interval."""
+    """Check silence duration; re-arms its own timer for the next useful check."""
     global G
+    # Timer should already be gone when disabled; remove it if something re-armed it
+    if not G.plugin_enabled:
+        disarm_event_loop()
+        return
+    event_logging = G.event_logging
     
     # Check if plugin should be active based on streaming/recording state
     if G.enable_only_active:
@@ -174,9 +689,8 @@ def event_loop():
 
         # Reset state when output state changes (start or stop)
         if G.prev_output_active != output_active:
-            G.silence_duration = 0
-            G.notification_sent = False
-            if G.event_logging:
+            reset_silence()
+            if event_logging:
                 if output_active:
                     print("Recording/streaming started - reset notification state")
                 else:
@@ -185,78 +699,99 @@ def event_loop():
         G.prev_output_active = output_active
 
         if not output_active:
-            if G.event_logging:
+            if event_logging:
                 print("Not streaming or recording - plugin inactive")
+            arm_event_loop(G.tick)
             return
     
-    if G.event_logging:
+    if event_logging:
         print(f"G.noise = {G.noise} dB (Silence Duration: {G.silence_duration}s)")
-    if G.duration > G.start_delay:
-        if not G.lock:
-            if G.event_logging:
-                print("Initializing volmeter...")
-            source = g_obs_get_source_by_name(G.mic_source_name.encode("utf-8"))
-            if not source:
-                print(f"Error: Audio Capture source '{G.mic_source_name}' not found!")
-                return
-            G.volmeter = g_obs_volmeter_create(OBS_FADER_LOG)
-            if not G.volmeter:
-                print("Error: Failed to create volmeter!")
-                g_obs_source_release(source)
-                return
-            g_obs_volmeter_add_callback(G.volmeter, volmeter_callback, None)
-            if g_obs_volmeter_attach_source(G.volmeter, source):
-                g_obs_source_release(source)
-                G.lock = True
-                if G.event_logging:
-                    print("Volmeter attached to Audio Capture source.")
-            else:
-                print("Error: Failed to attach volmeter to Audio Capture source!")
-                g_obs_volmeter_destroy(G.volmeter)
-                g_obs_source_release(source)
-                return
-        # Check for silence
-        if G.noise <= G.silence_db_threshold or math.isinf(G.noise):  # Silence or -inf
-            G.silence_duration += G.tick / 1000  # Increment silence duration by tick interval in seconds
-            if G.silence_duration >= G.silence_threshold:
-                if G.event_logging:
-                    print(f"Silence detected for {G.silence_threshold} seconds.")
-                
-                # Send Windows notification (only once per silence period)
-                if G.enable_windows_notification and not G.notification_sent:
-                    send_windows_notification(G.notification_title, G.notification_message)
-                    G.notification_sent = True
-                
-                # Enable OBS source if option is enabled
-                if G.enable_obs_source:
-                    enable_source(True)
+    if time.monotonic_ns() - G.load_ns > G.start_delay * 1e9:
+        if not G.lock and not attach_volmeter():
+            arm_event_loop(G.tick)
+            return
+        # Snapshot state used below; only the changed fields are written back
+        silence_threshold = G.silence_threshold
+        notification_sent = G.notification_sent
+        enable_obs_source = G.enable_obs_source
+
+        # Check for silence (time since the last peak seen by volmeter_callback)
+        # Clamped because volmeter_callback may stamp a peak after the clock is read
+        silence_duration = max(0.0, (time.monotonic_ns() - G.last_sound_ns) / 1e9)
+        if silence_duration >= silence_threshold:
+            if event_logging:
+                print(f"Silence detected for {silence_threshold} seconds.")
+            
+            # Send Windows notification (only once per silence period)
+            if G.enable_windows_notification and not notification_sent:
+                send_windows_notification(G.notification_title, G.notification_message)
+                notification_sent = True
+            
+            # Enable OBS source if option is enabled
+            if enable_obs_source:
+                enable_source(True)
         else:
-            # Sound detected - reset
-            if G.silence_duration > 0:
-                if G.event_logging:
+            # Sound detected within the threshold - reset
+            if notification_sent:
+                if event_logging:
                     print("Sound detected - resetting silence counter")
-            G.silence_duration = 0
-            G.notification_sent = False  # Reset notification flag
-            if G.enable_obs_source:
+            notification_sent = False  # Reset notification flag
+            if enable_obs_source:
                 enable_source(False)
-    else:
-        G.duration += G.tick_mili  # Increment duration by tick interval
+        G.silence_duration = silence_duration
+        G.notification_sent = notification_sent
+
+        # Below the threshold nothing can happen until it is reached (a peak only
+        # pushes it further away), so sleep until then; after an alert, poll at
+        # the configured interval to notice the sound coming back
+        if silence_duration < silence_threshold:
+            next_delay = max(MIN_TIMER_DELAY_MS, int((silence_threshold - silence_duration) * 1000) + 1)
+        else:
+            next_delay = G.tick
+        arm_event_loop(next_delay)
+        if event_logging:
+            print(f"Next check in {next_delay / 1000}s")
 
 def enable_source(enable):
     """Enable or disable the specified source (image, media or video)."""
-    source_name = G.image_source_name or G.media_source_name or G.video_source_name
+    # A dirty scene cache means items were added or removed since the state was pushed
+    if enable == G.last_enable_state and not G.scene_cache_dirty:
+        return
+    source_name = G.alert_source_name
     if not source_name:
         if G.event_logging:
             print("No OBS source selected for alert")
         return
     # Use the _Functions class to set visibility
     func = _Functions(source_name)
-    func.set_visible_all(enable)
+    if not func.set_visible_all(enable):
+        # Nothing live was toggled; forget the state so the next call retries
+        G.last_enable_state = None
+        return
+    G.last_enable_state = enable
     if G.event_logging:
         print(f"Source '{source_name}' {'enabled' if enable else 'disabled'}")
 
 def on_frontend_event(event):
-    """Handle OBS frontend events for recording/streaming start/stop."""
+    """Handle OBS frontend events for scene changes and recording/streaming start/stop."""
+    if event == obs.OBS_FRONTEND_EVENT_SCENE_COLLECTION_CHANGED:
+        invalidate_props_source_cache()
+
+    # Keep the scene item cache in sync with the scene list; the rebuild itself
+    # happens on the next lookup, on the timer thread
+    if event in (obs.OBS_FRONTEND_EVENT_FINISHED_LOADING,
+                 obs.OBS_FRONTEND_EVENT_SCENE_LIST_CHANGED,
+                 obs.OBS_FRONTEND_EVENT_SCENE_CHANGED,
+                 obs.OBS_FRONTEND_EVENT_SCENE_COLLECTION_CHANGED):
+        mark_scene_cache_dirty()
+        return
+    if event in (obs.OBS_FRONTEND_EVENT_SCENE_COLLECTION_CLEANUP,
+                 obs.OBS_FRONTEND_EVENT_EXIT):
+        with G.scene_cache_lock:
+            release_scene_cache()
+            G.scene_cache_dirty = True
+        return
+
     if not G.enable_only_active:
         return
 
@@ -265,8 +800,7 @@ def on_frontend_event(event):
                  obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED,
                  obs.OBS_FRONTEND_EVENT_STREAMING_STARTED,
                  obs.OBS_FRONTEND_EVENT_STREAMING_STOPPED):
-        G.silence_duration = 0
-        G.notification_sent = False
+        reset_silence()
         if G.event_logging:
             event_names = {
                 obs.OBS_FRONTEND_EVENT_RECORDING_STARTED: "Recording started",
@@ -290,13 +824,33 @@ def script_description():
 
 def script_load(settings):
     """Called when the script is loaded."""
+    G.load_ns = time.monotonic_ns()
     obs.obs_frontend_add_event_callback(on_frontend_event)
+    signal_handler = obs.obs_get_signal_handler()
+    for signal in PROPS_SOURCE_SIGNALS:
+        obs.signal_handler_connect(signal_handler, signal, on_source_list_changed)
+    if sys.platform == "win32":
+        start_notification_worker()
 
 def script_unload():
     # Remove frontend event callback
     obs.obs_frontend_remove_event_callback(on_frontend_event)
-    # Remove timer
-    obs.timer_remove(event_loop)
+    # Remove source signal handlers
+    signal_handler = obs.obs_get_signal_handler()
+    for signal in PROPS_SOURCE_SIGNALS:
+        obs.signal_handler_disconnect(signal_handler, signal, on_source_list_changed)
+    # Remove timers
+    disarm_event_loop()
+    obs.timer_remove(flush_notifications)
+    G.batch_timer_armed = False
+    G.pending_notifications.clear()
+    # Release cached scene items
+    obs.timer_remove(drop_scene_cache)
+    G.scene_drop_armed = False
+    with G.scene_cache_lock:
+        release_scene_cache()
+    # Stop the notification worker (releases WinRT notifier and PowerShell session)
+    stop_notification_worker()
     # Clean up volmeter
     if G.volmeter:
         g_obs_volmeter_remove_callback(G.volmeter, volmeter_callback, None)
@@ -348,11 +902,8 @@ def script_properties():
     obs.obs_properties_add_bool(props, "event_logging", "デバッグログを有効にする")
 
     # Populate dropdowns with available sources
-    sources = obs.obs_enum_sources()
-    if sources:
-        for source in sources:
-            source_id = obs.obs_source_get_id(source)
-            name = obs.obs_source_get_name(source)
+    for source_id, names in get_props_source_cache().items():
+        for name in names:
             # Add audio sources to the audio capture dropdown
             if source_id in ["wasapi_input_capture", "wasapi_output_capture", "coreaudio_input_capture", "dshow_input", "pulse_input_capture", "alsa_input_capture"]:
                 obs.obs_property_list_add_string(mic_list, name, name)
@@ -363,30 +914,21 @@ def script_properties():
                 obs.obs_property_list_add_string(source_list, f"[メディア] {name}", f"media:{name}")
             elif source_id == "dshow_input":
                 obs.obs_property_list_add_string(source_list, f"[映像] {name}", f"video:{name}")
-        obs.source_list_release(sources)
     return props
 
 def script_update(settings):
     G.mic_source_name = obs.obs_data_get_string(settings, "mic_source_name")
+    G.mic_source_name_b = (G.mic_source_name or "").encode("utf-8")
+    G.mic_source_name_c = c_char_p(G.mic_source_name_b)
     
     # Parse combined source selection
-    combined_source = obs.obs_data_get_string(settings, "combined_source")
-    if combined_source and combined_source.startswith("image:"):
-        G.image_source_name = combined_source[6:]
-        G.media_source_name = ""
-        G.video_source_name = ""
-    elif combined_source and combined_source.startswith("media:"):
-        G.media_source_name = combined_source[6:]
-        G.image_source_name = ""
-        G.video_source_name = ""
-    elif combined_source and combined_source.startswith("video:"):
-        G.video_source_name = combined_source[6:]
-        G.image_source_name = ""
-        G.media_source_name = ""
-    else:
-        G.image_source_name = ""
-        G.media_source_name = ""
-        G.video_source_name = ""
+    kind, _, name = (obs.obs_data_get_string(settings, "combined_source") or "").partition(":")
+    for field in ALERT_SOURCE_FIELDS.values():
+        setattr(G, field, "")
+    G.alert_source_name = ""
+    if kind in ALERT_SOURCE_FIELDS:
+        setattr(G, ALERT_SOURCE_FIELDS[kind], name)
+        G.alert_source_name = name
     
     G.tick = (obs.obs_data_get_int(settings, "tick_interval") or 10) * 1000
     G.silence_threshold = obs.obs_data_get_int(settings, "silence_threshold") or 30
@@ -408,20 +950,23 @@ def script_update(settings):
     
     # Reset silence duration if plugin enabled state changed
     if prev_plugin_enabled != G.plugin_enabled or prev_enable_only_active != G.enable_only_active:
-        G.silence_duration = 0
-        G.notification_sent = False
+        reset_silence()
         if G.event_logging:
             print("Reset silence duration due to plugin state change")
     
+    # Drop refs now (the alert source or option may have changed); rebuild on the next lookup
+    with G.scene_cache_lock:
+        release_scene_cache()
+        G.scene_cache_dirty = True
+
     # Remove existing timer if any
-    obs.timer_remove(event_loop)
+    disarm_event_loop()
     # Only add timer if plugin is enabled
     if G.plugin_enabled:
         # Reset output tracking state so recording start/stop will be detected fresh
         G.prev_output_active = False
-        G.silence_duration = 0
-        G.notification_sent = False
-        obs.timer_add(event_loop, G.tick)
+        reset_silence()
+        arm_event_loop(G.tick)
         if G.event_logging:
             print(f"Plugin enabled - monitoring '{G.mic_source_name}'")
             print(f"Check interval: {G.tick / 1000}s, Silence threshold: {G.silence_threshold}s")